@@ -95,8 +95,9 @@ def main():
     
     # Import and run the main application
     try:
-        from gitaiops import main
+        from gitaiops import main, install_event_loop
         import asyncio
+        install_event_loop()
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n👋 GitAIOps Platform stopped")